@@ -1,5 +1,6 @@
 from pathlib import Path
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 import copy
 import logging
 import math
@@ -10,6 +11,7 @@ class PageReplacementAlgo(ABC):
         self.total_page_frames: int = total_page_frames
         self.frames: list = []
         self.pages: list[int] = pages
+        self._in_frames: set[int] = set() # mirrors frames for O(1) membership
 
 
     def isFull(self) -> bool:
@@ -25,27 +27,31 @@ class PageReplacementAlgo(ABC):
     def add_page(self, index: int):
         page: int = self.pages[index]
         self.frames.append(page)
+        self._in_frames.add(page)
 
 
     @abstractmethod
     def replace_page(self, index: int):
-        self.frames.pop(0)
+        victim = self.frames.pop(0)
+        self._in_frames.discard(victim)
         self.add_page(index)
 
     
     def run(self) -> int:
         total_page_faults: int = 0
+        # look these up once rather than on every reference
+        in_frames, get_page, add_page, replace_page, isFull = self._in_frames, self.get_page, self.add_page, self.replace_page, self.isFull
 
         for index, page in enumerate(self.pages):
 
-            if page in self.frames: 
-                self.get_page(index)
+            if page in in_frames: 
+                get_page(index)
                 continue
 
-            if self.isFull():
-                self.replace_page(index)
+            if isFull():
+                replace_page(index)
             else:
-                self.add_page(index)
+                add_page(index)
 
             total_page_faults += 1
 
@@ -58,30 +64,33 @@ class Optimal(PageReplacementAlgo):
     def __init__(self, total_page_frames: int, pages: list[int]) -> None:
         super().__init__(total_page_frames, pages)
 
+        # next_use[i] is the index of the next reference to pages[i] (inf if no more references)
+        self.next_use: list[float] = [math.inf] * len(pages)
+        last_seen: dict[int, int] = {}
+        for i in range(len(pages) - 1, -1, -1):
+            self.next_use[i] = last_seen.get(pages[i], math.inf)
+            last_seen[pages[i]] = i
+
+        self.frames: dict[int, float] = {} # page -> its next reference, in load order
+        self._in_frames = self.frames.keys()
+
 
     def get_page(self, index: int):
-        pass
+        self.frames[self.pages[index]] = self.next_use[index]
 
 
     def add_page(self, index: int):
         page: int = self.pages[index]
-        self.frames.append(page)
+        self.frames[page] = self.next_use[index]
 
 
     def replace_page(self, index: int):
         """
         Replace the page whose next reference is furthest in future
         """
+        victim = max(self.frames, key=self.frames.__getitem__)
 
-        remaining_pages = self.pages[index+1:] # only looking at future references
-
-        # getting future references for current frames (inf if no more references)
-        next_references = [remaining_pages.index(page) if page in remaining_pages else math.inf for page in self.frames]
-
-        furthest_reference = max(next_references)
-        furthest_index = next_references.index(furthest_reference)
-
-        self.frames.pop(furthest_index)
+        del self.frames[victim]
         self.add_page(index)
 
 
@@ -89,6 +98,12 @@ class Optimal(PageReplacementAlgo):
 class FIFO(PageReplacementAlgo):
     def __init__(self, total_page_frames: int, pages: list[int]) -> None:
         super().__init__(total_page_frames, pages)
+        self.frames = [None] * total_page_frames # circular buffer
+        self.hand = 0 # next slot to write, which holds the oldest page once full
+
+
+    def isFull(self) -> bool:
+        return len(self._in_frames) >= self.total_page_frames
 
 
     def get_page(self, index: int):
@@ -97,11 +112,16 @@ class FIFO(PageReplacementAlgo):
 
     def add_page(self, index: int):
         page: int = self.pages[index]
-        self.frames.append(page)
+        self.frames[self.hand] = page
+        self._in_frames.add(page)
+        self.hand = (self.hand + 1) % self.total_page_frames
 
     
     def replace_page(self, index: int):
-        self.frames.pop(0)
+        """
+        Overwrite the oldest page in place
+        """
+        self._in_frames.discard(self.frames[self.hand])
         self.add_page(index)
 
 
@@ -109,6 +129,8 @@ class FIFO(PageReplacementAlgo):
 class LRU(PageReplacementAlgo):
     def __init__(self, total_page_frames: int, pages: list[int]) -> None:
         super().__init__(total_page_frames, pages)
+        self.frames: OrderedDict[int, None] = OrderedDict() # bottom of the stack first
+        self._in_frames = self.frames.keys() # live view, no separate set to maintain
 
 
     def get_page(self, index):
@@ -116,20 +138,19 @@ class LRU(PageReplacementAlgo):
         Referenced page gets put back to the top of the stack
         """
         page: int = self.pages[index]
-        self.frames.pop(self.frames.index(page))
-        self.add_page(index)
+        self.frames.move_to_end(page)
 
 
     def add_page(self, index: int):
         page: int = self.pages[index]
-        self.frames.append(page)
+        self.frames[page] = None
 
     
     def replace_page(self, index: int):
         """
         Replace least recently referenced page which is at the bottom of the stack
         """
-        self.frames.pop(0)
+        self.frames.popitem(last=False)
         self.add_page(index)
 
 
@@ -141,6 +162,8 @@ class SecondChance(PageReplacementAlgo):
         self.bits = [0] * total_page_frames
         self.hand = 0 
         self.current_size = 0 # Track how many slots are actually filled
+        self.page_to_slot: dict[int, int] = {} # frame index holding each page
+        self._in_frames = self.page_to_slot.keys()
 
 
     def isFull(self) -> bool:
@@ -159,8 +182,7 @@ class SecondChance(PageReplacementAlgo):
         Referenced page get its second chance
         """
         page = self.pages[index]
-        frame_index = self.frames.index(page)
-        self.bits[frame_index] = 1
+        self.bits[self.page_to_slot[page]] = 1
 
 
     def add_page(self, index: int):
@@ -169,6 +191,7 @@ class SecondChance(PageReplacementAlgo):
         """
         page = self.pages[index]
         self.frames[self.hand] = page
+        self.page_to_slot[page] = self.hand
         self.bits[self.hand] = 0
         self.current_size += 1
         self.advance_hand()
@@ -183,6 +206,7 @@ class SecondChance(PageReplacementAlgo):
                 self.bits[self.hand] = 0
                 self.advance_hand()
             else:
+                del self.page_to_slot[self.frames[self.hand]]
                 self.frames[self.hand] = None
                 self.current_size -= 1
                 self.add_page(index)
@@ -198,13 +222,12 @@ class Simulation:
 
 
     def read_data(self, data_path: Path) -> None: 
-        with open(data_path, "r") as f:
-            self.total_page_frames = int(f.readline())
-
-            line = f.readline()
-            while line != "":
-                self.pages.append(int(line.strip()))
-                line = f.readline()
+        """
+        First number is the frame count, the rest are page references
+        """
+        tokens = Path(data_path).read_text().split()
+        self.total_page_frames = int(tokens[0])
+        self.pages = list(map(int, tokens[1:]))
 
 
     def __str__(self) -> str:
@@ -1,10 +1,18 @@
 import math
 from pathlib import Path
 from abc import ABC, abstractmethod
-import copy
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import itertools
 import logging
 
+JobSpec = namedtuple("JobSpec", "id submitted_at duration") # immutable job data as read from file
+
+
 class Job:
+    __slots__ = ("id", "submitted_at", "duration", "currentDuration", "finished_at")
+
     def __init__(self, id, submitted_at, duration) -> None:
         self.id = int(id)
         self.submitted_at = int(submitted_at)
@@ -14,9 +22,13 @@ class Job:
         self.finished_at = math.inf
 
 
-    def is_finished(self) -> bool:
-        return self.currentDuration <= 0 
-    
+    def reset(self) -> None:
+        """
+        Put the job back to its unstarted state so it can be reused for another run
+        """
+        self.currentDuration = self.duration
+        self.finished_at = math.inf
+
 
     def finish(self, time) -> None:
         self.finished_at = time
@@ -26,16 +38,14 @@ class Job:
         return self.finished_at - self.submitted_at
     
 
-    def work(self) -> None:
-        self.currentDuration -= 1
-
-
     def __str__(self) -> str:
         return f"Job {self.id} submitted at {self.submitted_at} with duration {self.duration}"
     
 
 
 class PerformanceMetric:
+    __slots__ = ("throughput", "turnaround", "context_switches")
+
     def __init__(self, throughput, turnaround, context_switches) -> None:
         self.throughput = throughput
         self.turnaround = turnaround
@@ -49,14 +59,17 @@ class PerformanceMetric:
 
 class Scheduler(ABC):
     def __init__(self, jobs: list[Job]) -> None:
-        self.unfinished_jobs: list[Job] = jobs
-        self.queue: list[Job] = []
+        self.unfinished_jobs: list[Job] = sorted(jobs, key=lambda job: job.submitted_at)
+        self._next_idx: int = 0 # first job in unfinished_jobs that hasn't arrived yet
+        self.queue: deque[Job] = deque()
         self.current_job: Job = None 
         self.finished_jobs: list[Job] = []
 
         self.total_jobs: int = len(self.unfinished_jobs)
         self.time = 0
+        self.elapsed: int = 1 # time passed since the previous event
         self.total_context_switches: int = 0
+        self.total_turnaround: int = 0 # running sum so get_performance needn't walk finished_jobs
         self.added_jobs: bool = False
 
 
@@ -64,23 +77,32 @@ class Scheduler(ABC):
         """
         Add ready jobs to queue base on current time
         """
-        ready = [job for job in self.unfinished_jobs if job.submitted_at <= self.time]
-        if ready: self.added_jobs = True
-        self.unfinished_jobs = [j for j in self.unfinished_jobs if j.submitted_at > self.time]
-        self.queue.extend(ready)
+        while self._next_idx < len(self.unfinished_jobs) and self.unfinished_jobs[self._next_idx].submitted_at <= self.time:
+            self.enqueue(self.unfinished_jobs[self._next_idx])
+            self._next_idx += 1
+            self.added_jobs = True
 
 
-    def work(self) -> None:
+    def enqueue(self, job: Job) -> None:
         """
-        Work on current job and manages the finishing process
+        Add a job to the back of the queue
         """
-        if self.current_job is not None:
-            self.current_job.work()
+        self.queue.append(job)
+
 
-        if self.current_job is not None and self.current_job.is_finished():
-            self.current_job.finish(self.time)
-            # print(f"Finished at {self.time}: {self.current_job}")
-            self.finished_jobs.append(self.current_job)
+    def work(self) -> None:
+        """
+        Work on current job for the time elapsed since the previous event and manages the finishing process
+        """
+        current_job = self.current_job
+        if current_job is None: return
+
+        current_job.currentDuration -= self.elapsed
+        if current_job.currentDuration <= 0:
+            current_job.finish(self.time)
+            self.total_turnaround += current_job.getTurnaround()
+            # print(f"Finished at {self.time}: {current_job}")
+            self.finished_jobs.append(current_job)
             self.current_job = None
 
 
@@ -92,23 +114,42 @@ class Scheduler(ABC):
         pass
 
 
+    def next_event(self) -> int:
+        """
+        Earliest time the state can change: a job arrives or the current job finishes.
+        With the CPU idle and nothing queued this jumps straight over the gap to the next arrival.
+        """
+        events = []
+        if self._next_idx < len(self.unfinished_jobs): events.append(self.unfinished_jobs[self._next_idx].submitted_at)
+        if self.current_job is not None: events.append(self.time + self.current_job.currentDuration)
+        return min(events, default=self.time + 1)
+
+
     def get_performance(self) -> PerformanceMetric:
         throughput = self.total_jobs / self.time
-        turnaround = sum([job.getTurnaround() for job in self.finished_jobs]) / self.total_jobs
+        turnaround = self.total_turnaround / self.total_jobs
         return PerformanceMetric(throughput, turnaround, self.total_context_switches)
 
     
     def run(self) -> PerformanceMetric:
         """
-        Template Pattern shared across all schedulers
+        Template Pattern shared across all schedulers.
+        Time jumps straight to the next event instead of ticking every second.
         """
-        while len(self.finished_jobs) != self.total_jobs:
-            self.get_ready_jobs()
-            self.work()
-            self.context_switch()
-            self.time += 1
+        # look the steps up once rather than on every event
+        get_ready_jobs, work, context_switch, next_event = self.get_ready_jobs, self.work, self.context_switch, self.next_event
+        finished_jobs, total_jobs = self.finished_jobs, self.total_jobs
+
+        while len(finished_jobs) != total_jobs:
+            get_ready_jobs()
+            work()
+            context_switch()
             self.added_jobs = False
 
+            next_time = next_event()
+            self.elapsed = next_time - self.time
+            self.time = next_time
+
         return self.get_performance()
 
 
@@ -125,7 +166,7 @@ class FCFS(Scheduler):
         if not self.queue: return
 
         if self.current_job is None:
-            self.current_job = self.queue.pop(0) # get next job
+            self.current_job = self.queue.popleft() # get next job
             self.total_context_switches += 1
 
 
@@ -136,15 +177,19 @@ class SJF(Scheduler):
     """
     def __init__(self, jobs: list[Job]) -> None:
         super().__init__(jobs)
+        self.queue: list[tuple[int, int, Job]] = [] # min-heap keyed on duration
+        self.tiebreak = itertools.count() # keeps arrival order among equal durations
+
+
+    def enqueue(self, job: Job) -> None:
+        heapq.heappush(self.queue, (job.duration, next(self.tiebreak), job))
 
 
     def context_switch(self) -> None:
         if not self.queue: return
 
         if self.current_job is None:      
-            shortest_job = min(self.queue, key=lambda job: job.duration) # get shortest job in queue
-            self.queue.remove(shortest_job)
-            self.current_job = shortest_job
+            _, _, self.current_job = heapq.heappop(self.queue) # get shortest job in queue
             self.total_context_switches += 1
 
 
@@ -155,25 +200,35 @@ class SRTN(Scheduler):
     """
     def __init__(self, jobs: list[Job]) -> None:
         super().__init__(jobs)
+        self.queue: list[tuple[int, int, Job]] = [] # min-heap keyed on remaining duration
+        self.tiebreak = itertools.count() # keeps arrival order among equal remaining durations
+
+
+    def enqueue(self, job: Job) -> None:
+        """
+        Queued jobs don't run, so their remaining duration is a stable heap key.
+        The running job is kept out of the heap and only compared against the top.
+        """
+        heapq.heappush(self.queue, (job.currentDuration, next(self.tiebreak), job))
 
 
     def context_switch(self) -> None:
         if not self.queue: return
 
-        shortest_runtime_job = min(self.queue, key=lambda job: job.currentDuration)
-
         if self.current_job is None:
-            self.queue.remove(shortest_runtime_job)
-            self.current_job = shortest_runtime_job
+            _, _, self.current_job = heapq.heappop(self.queue)
             self.total_context_switches += 1
 
-        elif shortest_runtime_job.currentDuration < self.current_job.currentDuration:
-            self.queue.remove(shortest_runtime_job)
-            self.queue.append(self.current_job) # incomplete job gets added back to queue
+        elif not self.added_jobs:
+            return # queue is unchanged, so the running job is still the shortest
+
+        elif self.queue[0][0] < self.current_job.currentDuration:
+            _, _, shortest_runtime_job = heapq.heappop(self.queue)
+            self.enqueue(self.current_job) # incomplete job gets added back to queue
             self.current_job = shortest_runtime_job
             self.total_context_switches += 1
         
-        elif shortest_runtime_job.currentDuration >= self.current_job.currentDuration and self.added_jobs:
+        else:
             self.total_context_switches += 1
 
 
@@ -182,16 +237,56 @@ class RR(Scheduler):
     """
     Round Robin
     """
-    def __init__(self, jobs: list[Job]) -> None:
+    def __init__(self, jobs: list[Job], quantum: int = 4) -> None:
         super().__init__(jobs)
+        self.quantum: int = quantum
+        self.slice_left: int = 0 # time left in the current job's quantum
 
 
     def context_switch(self) -> None:
-        self.total_context_switches += 1
+        if self.current_job is not None:
+            self.slice_left -= self.elapsed
+            if self.slice_left > 0: return # quantum not used up yet
+
+            if not self.queue:
+                self.slice_left = self.quantum # nobody waiting, keeps the CPU for another quantum
+                return
+
+            self.queue.append(self.current_job) # incomplete job gets added back to queue
+            self.current_job = None
+
         if not self.queue: return
 
-        if self.current_job is not None: self.queue.append(self.current_job) # incomplete job gets added back to queue
-        self.current_job = self.queue.pop(0)
+        self.current_job = self.queue.popleft()
+        self.slice_left = self.quantum
+        self.total_context_switches += 1
+
+
+    def next_event(self) -> int:
+        next_time = super().next_event()
+        if self.current_job is not None: next_time = min(next_time, self.time + self.slice_left) # quantum expires
+        return next_time
+
+
+
+worker_jobs: list[Job] = [] # built once per worker process and reused by every run in it
+
+
+def init_worker(job_specs: list[JobSpec]) -> None:
+    """
+    Worker process initializer: build the job pool from the specs
+    """
+    global worker_jobs
+    worker_jobs = [Job(*spec) for spec in job_specs]
+
+
+def run_scheduler(scheduler: type[Scheduler]) -> PerformanceMetric:
+    """
+    Worker process task: reset the pooled jobs and run one scheduler on them
+    """
+    for job in worker_jobs:
+        job.reset()
+    return scheduler(worker_jobs).run()
 
 
 
@@ -203,32 +298,29 @@ class Simulation:
         self.jobs = self.read_data(data_path)
 
 
-    def read_data(self, file_path: Path) -> list[Job]:
-        jobs: list[Job] = []
-
-        with open(file_path, "r") as f:
-            line = f.readline()
-            while line != "":
-                tokens = line.split()
-                jobs.append(Job(tokens[0], tokens[1], tokens[2]))
-                line = f.readline()
-
-        return jobs
+    def read_data(self, file_path: Path) -> list[JobSpec]:
+        """
+        Each line is "id submitted_at duration"; the whole file is split in one go
+        """
+        tokens = iter(map(int, Path(file_path).read_text().split()))
+        return [JobSpec(id, submitted_at, duration) for id, submitted_at, duration in zip(tokens, tokens, tokens)]
     
 
     def printJobs(self) -> None:
-        for job in self.jobs:
-            print(job)
+        for spec in self.jobs:
+            print(Job(*spec))
 
 
     def run(self):
+        """
+        Schedulers are independent what-if runs on the same jobs, so each gets its own process
+        """
         schedulers = [FCFS, SJF, SRTN, RR]
         print(f"algorithm, turnaround, context_switches")
-        for scheduler in schedulers:
-            jobs_copy = copy.deepcopy(self.jobs)
-            manager = scheduler(jobs_copy)
-            result = manager.run()
-            print(f"{scheduler.__name__}, {result}")
+        with ProcessPoolExecutor(max_workers=len(schedulers), initializer=init_worker, initargs=(self.jobs,)) as executor:
+            results = executor.map(run_scheduler, schedulers)
+            for scheduler, result in zip(schedulers, results):
+                print(f"{scheduler.__name__}, {result}")
 
 
 